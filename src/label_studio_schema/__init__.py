@@ -1,6 +1,14 @@
 from pathlib import Path
 
 ROOT = Path(__file__).parent
-LS_REPO = ROOT.parent.parent / "ls-files/label-studio"
 
-__all__ = "ROOT", "LS_REPO",
\ No newline at end of file
+
+def __getattr__(name: str) -> Path:
+    # resolve the cloned Label Studio repo path on first access only, it's only needed by the parsing tools
+    if name == "LS_REPO":
+        value = globals()[name] = ROOT.parent.parent / "ls-files/label-studio"
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = "ROOT", "LS_REPO",
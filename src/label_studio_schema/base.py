@@ -1,6 +1,90 @@
-from pydantic import BaseModel
+import sys
+from functools import lru_cache
+from io import StringIO
+from typing import Any, Callable, ClassVar, Iterable, TextIO
+from xml.etree.ElementTree import Element
 
-from label_studio_schema.tools.convert import into_xml
+from pydantic import BaseModel, ConfigDict
+
+from label_studio_schema.tools.convert import escape_xml, snake2camel, str_from_bool
+
+_FACTORY: Any = object()
+"""Stands in for the default of `default_factory` fields, which is only computed when rendering needs it."""
+
+
+def _is_rendered(value: Any) -> bool:
+    """Whether a field value becomes an XML attribute: None and empty values are omitted, `False` is kept."""
+    return value is not None and (bool(value) or isinstance(value, bool))
+
+
+def _xml_attr(prefix: str, value: Any) -> str:
+    """Render a single ` key="value"` attribute from its prefix, or an empty string if the value is omitted."""
+    if _is_rendered(value):
+        return prefix + escape_xml(value) + '"'
+    return ""
+
+
+@lru_cache(maxsize=4096)
+def _render_xml(open_tag: str, items: tuple[tuple[str, type, object], ...]) -> str:
+    """
+    Render (and cache) the XML string for a tag from its opening tag and hashable field items.
+
+    Arguments:
+    ---
+        open_tag (str):
+            The opening of the XML element, i.e. `"<" + tag name`.
+        items (tuple[tuple[str, type, object], ...]):
+            The `(attribute prefix, type of value, value)` triples of the tag, in field order. The type is part of
+            the cache key because `1`, `1.0` and `True` are equal and hash alike but render differently.
+
+    Returns:
+    ---
+        str: The XML string representation of the tag.
+    """
+    return "".join((open_tag, *[_xml_attr(prefix, v) for prefix, _, v in items], " />"))
+
+
+def _compile_xml(cls: type["BaseTag"]) -> Callable[["BaseTag", bool], str]:
+    """
+    Generate a specialized `xml()` method for a tag class, with its field layout baked into the source.
+
+    Arguments:
+    ---
+        cls (type[BaseTag]):
+            The tag class to generate the method for, after `__xml_open__` and `__xml_fields__` are set.
+
+    Returns:
+    ---
+        Callable[[BaseTag, bool], str]: The generated method. Rendering all fields builds the render-cache key
+            directly from the instance values; `no_defaults=True` and unhashable values defer to `BaseTag.xml`.
+            Classes without fields return a constant string.
+    """
+    if not cls.__xml_fields__:
+        # nothing to render per instance, the output is the same self-closing tag every time
+        src = f"def xml(self, no_defaults=False):\n    return {cls.__xml_open__ + ' />'!r}\n"
+    else:
+        items = "".join(
+            f"({prefix!r}, (v := d.get({name!r})).__class__, v), " for name, _, prefix in cls.__xml_fields__
+        )
+        src = (
+            "def xml(self, no_defaults=False):\n"
+            "    if no_defaults:\n"
+            "        return _xml(self, True)\n"
+            "    d = self.__dict__\n"
+            f"    items = ({items})\n"
+            "    try:\n"
+            f"        return _render({cls.__xml_open__!r}, items)\n"
+            "    except TypeError:\n"
+            "        return _xml(self)\n"
+        )
+    namespace: dict[str, Any] = {"_render": _render_xml, "_xml": BaseTag.xml}
+    exec(src, namespace)
+    xml = namespace["xml"]
+    xml.__doc__ = BaseTag.xml.__doc__
+    xml.__module__ = cls.__module__
+    xml.__qualname__ = f"{cls.__qualname__}.xml"
+    xml.__xml_compiled__ = True
+    return xml
 
 
 class BaseTag(BaseModel):
@@ -11,8 +95,74 @@ class BaseTag(BaseModel):
     ---
         xml(no_defaults: bool = False) -> str:
             Convert the tag object to an XML string.
+        write_xml(buf: TextIO, no_defaults: bool = False) -> None:
+            Write the tag object as XML directly into a text buffer.
+        render_many(tags: Iterable[BaseTag], buf: TextIO | None = None, no_defaults: bool = False) -> str:
+            Render many tag objects into a single shared buffer.
+        to_element(no_defaults: bool = False) -> Element:
+            Convert the tag object to an `xml.etree.ElementTree.Element`.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    __xml_open__: ClassVar[str] = "<BaseTag"
+    __xml_fields__: ClassVar[tuple[tuple[str, Any, str], ...]] = ()
+    __xml_dump__: ClassVar[bool] = False
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs) -> None:
+        # `model_fields` is only complete once pydantic has finished building the class
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__xml_open__ = "<" + cls.__name__
+        # the ` camelName="` attribute prefixes are interned so every render reuses the same string objects
+        cls.__xml_fields__ = tuple(
+            (
+                name,
+                _FACTORY if field.default_factory is not None else field.get_default(),
+                sys.intern(f' {snake2camel(name)}="'),
+            )
+            for name, field in cls.model_fields.items()
+        ) + tuple((name, None, sys.intern(f' {snake2camel(name)}="')) for name in cls.model_computed_fields)
+        # custom serialization (a core schema, serializers, computed or excluded fields) is only applied by
+        # `model_dump`, so such classes render from its output instead of the instance `__dict__`
+        decorators = cls.__pydantic_decorators__
+        cls.__xml_dump__ = bool(
+            cls.__get_pydantic_core_schema__.__func__ is not BaseModel.__get_pydantic_core_schema__.__func__
+            or decorators.field_serializers
+            or decorators.model_serializers
+            or cls.model_computed_fields
+            or any(field.exclude for field in cls.model_fields.values())
+        )
+        # specialize `xml` unless a class in the hierarchy defines its own, a compiled parent `xml` is replaced
+        # since it bakes in the parent's fields and `__dict__` access
+        if cls.xml is BaseTag.xml or getattr(cls.xml, "__xml_compiled__", False):
+            cls.xml = BaseTag.xml if cls.__xml_dump__ else _compile_xml(cls)
+        # keep `__str__` aliased to this class's `xml`, unless it was replaced with something else
+        if cls.__str__.__name__ == "xml":
+            cls.__str__ = cls.xml
+
+    def _xml_items(self, no_defaults: bool = False) -> tuple[tuple[str, Any], ...]:
+        """Collect `(attribute prefix, value)` pairs to render, skipping fields at their default if `no_defaults`."""
+        if self.__xml_dump__:
+            dumped = self.model_dump(exclude_defaults=no_defaults)
+            return tuple((prefix, dumped[name]) for name, _, prefix in self.__xml_fields__ if name in dumped)
+        values = self.__dict__
+        if no_defaults:
+            # fields that were never set hold their default, so only explicitly set ones need comparing
+            fields_set = self.__pydantic_fields_set__
+            items = []
+            for name, default, prefix in self.__xml_fields__:
+                if name not in fields_set:
+                    continue
+                if default is _FACTORY:  # factories may read the other fields, so call them per instance
+                    field = type(self).model_fields[name]
+                    default = field.get_default(call_default_factory=True, validated_data=values)
+                if (value := values.get(name)) != default:
+                    items.append((prefix, value))
+            return tuple(items)
+        # `model_construct` may leave required fields unset, those render like None and are skipped
+        return tuple((prefix, values.get(name)) for name, _, prefix in self.__xml_fields__)
+
     def xml(self, no_defaults: bool = False) -> str:
         """
         Converts the model instance into an XML string representation.
@@ -26,11 +176,79 @@ class BaseTag(BaseModel):
         ---
             str: The XML string representation of the model instance.
         """
-        fields: list[str] = into_xml(self.model_dump(exclude_defaults=no_defaults))
-        return f"<{self.__class__.__name__}{(' ' + ' '.join(fields) if fields else '')} />"
+        items = tuple((prefix, v.__class__, v) for prefix, v in self._xml_items(no_defaults))
+        try:
+            return _render_xml(self.__xml_open__, items)
+        except TypeError:  # unhashable field values, render without the cache
+            buf = StringIO()
+            self.write_xml(buf, no_defaults)
+            return buf.getvalue()
+
+    def write_xml(self, buf: TextIO, no_defaults: bool = False) -> None:
+        """
+        Writes the XML representation of the model instance into a text buffer, without building intermediate strings.
+
+        Arguments:
+        ---
+            buf (TextIO):
+                The buffer to write to, e.g. an `io.StringIO` shared across many tags.
+            no_defaults (bool):
+                If True, fields with default values will be excluded from the XML output. Defaults to False.
+        """
+        write = buf.write
+        write(self.__xml_open__)
+        for prefix, v in self._xml_items(no_defaults):
+            if _is_rendered(v):
+                write(prefix)
+                write(escape_xml(v))
+                write('"')
+        write(" />")
+
+    @classmethod
+    def render_many(cls, tags: Iterable["BaseTag"], buf: TextIO | None = None, no_defaults: bool = False) -> str:
+        """
+        Renders many tag objects into one shared buffer, e.g. the children of a container tag.
+
+        Arguments:
+        ---
+            tags (Iterable[BaseTag]):
+                The tag objects to render, in order.
+            buf (TextIO | None):
+                The buffer to write to. If None, a new `io.StringIO` is created. Defaults to None.
+            no_defaults (bool):
+                If True, fields with default values will be excluded from the XML output. Defaults to False.
 
-    def __str__(self) -> str:
-        return self.xml()
+        Returns:
+        ---
+            str: The concatenated XML strings of all tags (the full buffer contents when `buf` is given).
+        """
+        buf = StringIO() if buf is None else buf
+        for tag in tags:
+            tag.write_xml(buf, no_defaults)
+        return buf.getvalue()
+
+    def to_element(self, no_defaults: bool = False) -> Element:
+        """
+        Converts the model instance into an XML element, for building a tree of tags that is serialized once.
+
+        Arguments:
+        ---
+            no_defaults (bool):
+                If True, fields with default values will be excluded from the element attributes. Defaults to False.
+
+        Returns:
+        ---
+            Element: The element for this tag. Children can be added with `element.append(child.to_element())` and
+                escaping is left to `xml.etree.ElementTree.tostring`.
+        """
+        attrib = {
+            prefix[1:-2]: str_from_bool(v) if isinstance(v, bool) else str(v)  # prefix is ` camelName="`
+            for prefix, v in self._xml_items(no_defaults)
+            if _is_rendered(v)
+        }
+        return Element(self.__class__.__name__, attrib)
+
+    __str__ = xml
 
 
 class Control(BaseTag):
@@ -48,27 +266,6 @@ class Control(BaseTag):
     name: str
     to_name: str
 
-    def __len__(self) -> int:
-        raise NotImplementedError
-
-    def __getitem__(self, key: str) -> str:
-        raise NotImplementedError
-
-    def __setitem__(self, key: str, value: str) -> None:
-        raise NotImplementedError
-
-    def __delitem__(self, key: str) -> None:
-        raise NotImplementedError
-
-    def __iter__(self):
-        raise NotImplementedError
-
-    def __contains__(self, key: str) -> bool:
-        raise NotImplementedError
-
-    def append(self, item: str) -> None:
-        raise NotImplementedError
-
 
 class Object(BaseTag):
     """
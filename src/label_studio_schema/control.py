@@ -1,9 +1,17 @@
-from typing import Literal, Optional
+from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class BrushTag(BaseModel):
+class _Tag(BaseModel):
+    """
+    Base for the control tag models, which are plain immutable data containers.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class BrushTag(_Tag):
     """
     Brush Tag for Image Segmentation Labeling.
 
@@ -12,16 +20,14 @@ class BrushTag(BaseModel):
 
     name: str = Field(..., description="Name of the element.")
     toName: str = Field(..., description="Name of the image to label.")
-    choice: Optional[Literal["single", "multiple"]] = Field(
+    choice: Literal["single", "multiple"] = Field(
         "single",
         description="Configure whether the data labeler can select one or multiple labels.",
     )
     maxUsages: int = Field(
         ..., description="Maximum number of times a label can be used per task."
     )
-    showInline: Optional[bool] = Field(
-        True, description="Show labels in the same visual line."
-    )
+    showInline: bool = Field(True, description="Show labels in the same visual line.")
     smart: bool = Field(
         ..., description="Show smart tool for interactive pre-annotations."
     )
@@ -30,7 +36,7 @@ class BrushTag(BaseModel):
     )
 
 
-class BrushLabelsTag(BaseModel):
+class BrushLabelsTag(_Tag):
     """
     Brush Label Tag for Image Segmentation Labeling.
 
@@ -39,19 +45,17 @@ class BrushLabelsTag(BaseModel):
 
     name: str = Field(..., description="Name of the element.")
     toName: str = Field(..., description="Name of the image to label.")
-    choice: Optional[Literal["single", "multiple"]] = Field(
+    choice: Literal["single", "multiple"] = Field(
         "single",
         description="Configure whether the data labeler can select one or multiple labels.",
     )
     maxUsages: int = Field(
         ..., description="Maximum number of times a label can be used per task."
     )
-    showInline: Optional[bool] = Field(
-        True, description="Show labels in the same visual line."
-    )
+    showInline: bool = Field(True, description="Show labels in the same visual line.")
 
 
-class ChoiceTag(BaseModel):
+class ChoiceTag(_Tag):
     """
     Choice Tag for Single Choice Labels.
 
@@ -67,9 +71,7 @@ class ChoiceTag(BaseModel):
         ...,
         description="Alias for the choice. If used, the alias replaces the choice value in the annotation results. Alias does not display in the interface.",
     )
-    style: Literal["style"] = Field(
-        "...", description="CSS style of the checkbox element."
-    )
+    style: str = Field(..., description="CSS style of the checkbox element.")
     hotkey: str = Field(..., description="Hotkey for the selection.")
     html: str = Field(
         ...,
@@ -79,7 +81,7 @@ class ChoiceTag(BaseModel):
     color: str = Field(..., description="Color for Taxonomy item.")
 
 
-class ChoicesTag(BaseModel):
+class ChoicesTag(_Tag):
     """
     Choices Tag for Multiple Choice Labels.
 
@@ -90,20 +92,24 @@ class ChoicesTag(BaseModel):
     toName: str = Field(
         ..., description="Name of the data item that you want to label."
     )
-    choice: Optional[Literal["single", "single-radio", "multiple"]] = Field(
+    choice: Literal["single", "single-radio", "multiple"] = Field(
         "single", description="Single or multi-class classification."
     )
-    showInline: Optional[bool] = Field(
-        False, description="Show choices in the same visual line."
-    )
-    required: Optional[bool] = Field(
+    showInline: bool = Field(False, description="Show choices in the same visual line.")
+    required: bool = Field(
         False, description="Validate whether a choice has been selected."
     )
     requiredMessage: str = Field(..., description="Show a message if validation fails.")
-    visibleWhen: Literal[
-        "region-selected", "no-region-selected", "choice-selected", "choice-unselected"
-    ] = Field(
-        "...",
+    visibleWhen: (
+        Literal[
+            "region-selected",
+            "no-region-selected",
+            "choice-selected",
+            "choice-unselected",
+        ]
+        | None
+    ) = Field(
+        None,
         description="Control visibility of the choices. Can also be used with the `when*` parameters below to narrow down visibility.",
     )
     whenTagName: str = Field(
@@ -136,7 +142,7 @@ class ChoicesTag(BaseModel):
     )
 
 
-class EllipseTag(BaseModel):
+class EllipseTag(_Tag):
     """
     Ellipse Tag for Adding Elliptical Bounding Box to Images.
 
@@ -145,15 +151,11 @@ class EllipseTag(BaseModel):
 
     name: str = Field(..., description="Name of the element.")
     toName: str = Field(..., description="Name of the image to label.")
-    opacity: Optional[float] = Field(0.6, description="Opacity of ellipse.")
+    opacity: float = Field(0.6, description="Opacity of ellipse.")
     fillColor: str = Field(..., description="Ellipse fill color in hexadecimal.")
-    strokeColor: Optional[str] = Field(
-        "#f48a42", description="Stroke color in hexadecimal."
-    )
-    strokeWidth: Optional[int] = Field(1, description="Width of the stroke.")
-    canRotate: Optional[bool] = Field(
-        True, description="Show or hide rotation control."
-    )
+    strokeColor: str = Field("#f48a42", description="Stroke color in hexadecimal.")
+    strokeWidth: int = Field(1, description="Width of the stroke.")
+    canRotate: bool = Field(True, description="Show or hide rotation control.")
     smart: bool = Field(
         ..., description="Show smart tool for interactive pre-annotations."
     )
@@ -162,7 +164,7 @@ class EllipseTag(BaseModel):
     )
 
 
-class EllipseLabelsTag(BaseModel):
+class EllipseLabelsTag(_Tag):
     """
     Ellipse Label Tag for Labeling Images with Elliptical Bounding Boxes.
 
@@ -171,23 +173,21 @@ class EllipseLabelsTag(BaseModel):
 
     name: str = Field(..., description="Name of the element.")
     toName: str = Field(..., description="Name of the image to label.")
-    choice: Optional[Literal["single", "multiple"]] = Field(
+    choice: Literal["single", "multiple"] = Field(
         "single", description="Configure whether you can select one or multiple labels."
     )
     maxUsages: int = Field(
         ..., description="Maximum number of times a label can be used per task."
     )
-    showInline: Optional[bool] = Field(
-        True, description="Show labels in the same visual line."
-    )
-    opacity: Optional[float] = Field(0.6, description="Opacity of ellipse.")
+    showInline: bool = Field(True, description="Show labels in the same visual line.")
+    opacity: float = Field(0.6, description="Opacity of ellipse.")
     fillColor: str = Field(..., description="Ellipse fill color in hexadecimal.")
     strokeColor: str = Field(..., description="Stroke color in hexadecimal.")
-    strokeWidth: Optional[int] = Field(1, description="Width of stroke.")
-    canRotate: Optional[bool] = Field(True, description="Show or hide rotation option.")
+    strokeWidth: int = Field(1, description="Width of stroke.")
+    canRotate: bool = Field(True, description="Show or hide rotation option.")
 
 
-class HyperTextLabelsTag(BaseModel):
+class HyperTextLabelsTag(_Tag):
     """
     Hypertext Label Tag to Create Labeled Hypertext (HTML).
 
@@ -196,18 +196,16 @@ class HyperTextLabelsTag(BaseModel):
 
     name: str = Field(..., description="Name of the element.")
     toName: str = Field(..., description="Name of the HTML element to label.")
-    choice: Optional[Literal["single", "multiple"]] = Field(
+    choice: Literal["single", "multiple"] = Field(
         "single", description="Configure if you can select one or multiple labels."
     )
     maxUsages: int = Field(
         ..., description="Maximum number of times a label can be used per task."
     )
-    showInline: Optional[bool] = Field(
-        True, description="Show labels in the same visual line."
-    )
+    showInline: bool = Field(True, description="Show labels in the same visual line.")
 
 
-class KeyPointTag(BaseModel):
+class KeyPointTag(_Tag):
     """
     Keypoint Tag for Adding Keypoints to Images.
 
@@ -216,12 +214,10 @@ class KeyPointTag(BaseModel):
 
     name: str = Field(..., description="Name of the element.")
     toName: str = Field(..., description="Name of the image to label.")
-    opacity: Optional[float] = Field(0.9, description="Opacity of keypoint.")
-    fillColor: Optional[str] = Field(
-        "#8bad00", description="Keypoint fill color in hexadecimal."
-    )
-    strokeWidth: Optional[int] = Field(1, description="Width of the stroke.")
-    strokeColor: Optional[str] = Field(
+    opacity: float = Field(0.9, description="Opacity of keypoint.")
+    fillColor: str = Field("#8bad00", description="Keypoint fill color in hexadecimal.")
+    strokeWidth: int = Field(1, description="Width of the stroke.")
+    strokeColor: str = Field(
         "#8bad00", description="Keypoint stroke color in hexadecimal."
     )
     smart: bool = Field(
@@ -230,12 +226,12 @@ class KeyPointTag(BaseModel):
     smartOnly: bool = Field(
         ..., description="Only show smart tool for interactive pre-annotations."
     )
-    snap: Optional[Literal["pixel", "none"]] = Field(
+    snap: Literal["pixel", "none"] = Field(
         "none", description="Snap keypoint to image pixels."
     )
 
 
-class KeyPointLabelsTag(BaseModel):
+class KeyPointLabelsTag(_Tag):
     """
     Keypoint Label Tag for Labeling Keypoints.
 
@@ -244,23 +240,21 @@ class KeyPointLabelsTag(BaseModel):
 
     name: str = Field(..., description="Name of the element.")
     toName: str = Field(..., description="Name of the image to label.")
-    choice: Optional[Literal["single", "multiple"]] = Field(
+    choice: Literal["single", "multiple"] = Field(
         "single", description="Configure whether you can select one or multiple labels."
     )
     maxUsages: int = Field(
         ..., description="Maximum number of times a label can be used per task."
     )
-    showInline: Optional[bool] = Field(
-        True, description="Show labels in the same visual line."
-    )
-    opacity: Optional[float] = Field(0.9, description="Opacity of the keypoint.")
-    strokeWidth: Optional[int] = Field(1, description="Width of the stroke.")
-    snap: Optional[Literal["pixel", "none"]] = Field(
+    showInline: bool = Field(True, description="Show labels in the same visual line.")
+    opacity: float = Field(0.9, description="Opacity of the keypoint.")
+    strokeWidth: int = Field(1, description="Width of the stroke.")
+    snap: Literal["pixel", "none"] = Field(
         "none", description="Snap keypoint to image pixels."
     )
 
 
-class LabelTag(BaseModel):
+class LabelTag(_Tag):
     """
     Label Tag for Single Label Tags.
 
@@ -268,9 +262,7 @@ class LabelTag(BaseModel):
     """
 
     value: str = Field(..., description="Value of the label.")
-    selected: Optional[bool] = Field(
-        False, description="Whether to preselect this label."
-    )
+    selected: bool = Field(False, description="Whether to preselect this label.")
     maxUsages: int = Field(
         ..., description="Maximum number of times this label can be used per task."
     )
@@ -280,34 +272,32 @@ class LabelTag(BaseModel):
         description="Hotkey to use for the label. Automatically generated if not specified.",
     )
     alias: str = Field(..., description="Label alias.")
-    showAlias: Optional[bool] = Field(
+    showAlias: bool = Field(
         False, description="Whether to show alias inside label text."
     )
-    aliasStyle: Optional[str] = Field(
-        "opacity:0.6", description="CSS style for the alias."
-    )
-    size: Optional[str] = Field("medium", description="Size of text in the label.")
-    background: Optional[str] = Field(
+    aliasStyle: str = Field("opacity:0.6", description="CSS style for the alias.")
+    size: str = Field("medium", description="Size of text in the label.")
+    background: str = Field(
         "#36B37E", description="Background color of an active label in hexadecimal."
     )
-    selectedColor: Optional[str] = Field(
+    selectedColor: str = Field(
         "#ffffff", description="Color of text in an active label in hexadecimal."
     )
-    granularity: Literal["symbol", "word"] = Field(
-        "...",
+    granularity: Literal["symbol", "word"] | None = Field(
+        None,
         description="Set control based on symbol or word selection (only for Text).",
     )
     html: str = Field(
         ...,
         description="HTML code is used to display label button instead of raw text provided by `value` (should be properly escaped).",
     )
-    category: Literal["int"] = Field(
-        "...",
+    category: int = Field(
+        ...,
         description="Category is used in the export (in label-studio-converter lib) to make an order of labels for YOLO and COCO.",
     )
 
 
-class MagicWandTag(BaseModel):
+class MagicWandTag(_Tag):
     """
     Magic Wand Tag for Quick Thresholded Flood Filling During Image Segmentation.
 
@@ -316,20 +306,20 @@ class MagicWandTag(BaseModel):
 
     name: str = Field(..., description="Name of the element.")
     toName: str = Field(..., description="Name of the image to label.")
-    opacity: Optional[float] = Field(
+    opacity: float = Field(
         0.6, description="Opacity of the Magic Wand region during use."
     )
-    blurradius: Optional[int] = Field(
+    blurradius: int = Field(
         5,
         description="The edges of a Magic Wand region are blurred and simplified, this is the radius of the blur kernel.",
     )
-    defaultthreshold: Optional[int] = Field(
+    defaultthreshold: int = Field(
         15,
         description="When the user initially clicks without dragging, how far a color has to be from the initial selected pixel to also be selected.",
     )
 
 
-class NumberTag(BaseModel):
+class NumberTag(_Tag):
     """
     Number Tag to Numerically Classify.
 
@@ -340,15 +330,13 @@ class NumberTag(BaseModel):
     toName: str = Field(..., description="Name of the element that you want to label.")
     min: int = Field(..., description="Minimum number value.")
     max: int = Field(..., description="Maximum number value.")
-    step: Optional[int] = Field(1, description="Step for value increment/decrement.")
+    step: int = Field(1, description="Step for value increment/decrement.")
     defaultValue: int = Field(
         ...,
         description="Default number value; will be added automatically to result for required fields.",
     )
     hotkey: str = Field(..., description="Hotkey for increasing number value.")
-    required: Optional[bool] = Field(
-        False, description="Whether number is required or not."
-    )
+    required: bool = Field(False, description="Whether number is required or not.")
     requiredMessage: str = Field(
         ..., description="Message to show if validation fails."
     )
@@ -360,13 +348,13 @@ class NumberTag(BaseModel):
         ...,
         description="Use this tag to classify specific items inside the object instead of the whole object.",
     )
-    slider: Optional[bool] = Field(
+    slider: bool = Field(
         False,
         description="Use slider look instead of input; use min and max to add your constraints.",
     )
 
 
-class PairwiseTag(BaseModel):
+class PairwiseTag(_Tag):
     """
     Pairwise Tag to Compare Objects.
 
@@ -380,7 +368,7 @@ class PairwiseTag(BaseModel):
     selectionStyle: str = Field(..., description="Style for the selection.")
 
 
-class ParagraphLabelsTag(BaseModel):
+class ParagraphLabelsTag(_Tag):
     """
     Paragraph Label Tag for Paragraph Labels.
 
@@ -389,18 +377,16 @@ class ParagraphLabelsTag(BaseModel):
 
     name: str = Field(..., description="Name of the element.")
     toName: str = Field(..., description="Name of the paragraph element to label.")
-    choice: Optional[Literal["single", "multiple"]] = Field(
+    choice: Literal["single", "multiple"] = Field(
         "single", description="Configure whether you can select one or multiple labels."
     )
     maxUsages: int = Field(
         ..., description="Maximum number of times a label can be used per task."
     )
-    showInline: Optional[bool] = Field(
-        True, description="Show labels in the same visual line."
-    )
+    showInline: bool = Field(True, description="Show labels in the same visual line.")
 
 
-class PolygonTag(BaseModel):
+class PolygonTag(_Tag):
     """
     Polygon Tag for Adding Polygons to Images.
 
@@ -409,19 +395,17 @@ class PolygonTag(BaseModel):
 
     name: str = Field(..., description="Name of tag.")
     toname: str = Field(..., description="Name of image to label.")
-    opacity: Optional[int] = Field(0.6, description="Opacity of polygon.")
-    fillColor: Optional[str] = Field(
+    opacity: int = Field(0.6, description="Opacity of polygon.")
+    fillColor: str = Field(
         "transparent",
         description="Polygon fill color in hexadecimal or HTML color name.",
     )
-    strokeColor: Optional[str] = Field(
-        "#f48a42", description="Stroke color in hexadecimal."
-    )
-    strokeWidth: Optional[int] = Field(3, description="Width of stroke.")
-    pointSize: Optional[Literal["small", "medium", "large"]] = Field(
+    strokeColor: str = Field("#f48a42", description="Stroke color in hexadecimal.")
+    strokeWidth: int = Field(3, description="Width of stroke.")
+    pointSize: Literal["small", "medium", "large"] = Field(
         "small", description="Size of polygon handle points."
     )
-    pointStyle: Optional[Literal["rectangle", "circle"]] = Field(
+    pointStyle: Literal["rectangle", "circle"] = Field(
         "circle", description="Style of points."
     )
     smart: bool = Field(
@@ -430,12 +414,12 @@ class PolygonTag(BaseModel):
     smartOnly: bool = Field(
         ..., description="Only show smart tool for interactive pre-annotations."
     )
-    snap: Optional[Literal["pixel", "none"]] = Field(
+    snap: Literal["pixel", "none"] = Field(
         "none", description="Snap polygon to image pixels."
     )
 
 
-class PolygonLabelsTag(BaseModel):
+class PolygonLabelsTag(_Tag):
     """
     Polygon Label Tag for Labeling Polygons in Images.
 
@@ -444,31 +428,29 @@ class PolygonLabelsTag(BaseModel):
 
     name: str = Field(..., description="Name of tag.")
     toName: str = Field(..., description="Name of image to label.")
-    choice: Optional[Literal["single", "multiple"]] = Field(
+    choice: Literal["single", "multiple"] = Field(
         "single", description="Configure whether you can select one or multiple labels."
     )
     maxUsages: int = Field(
         ..., description="Maximum number of times a label can be used per task."
     )
-    showInline: Optional[bool] = Field(
-        True, description="Show labels in the same visual line."
-    )
-    opacity: Optional[int] = Field(0.2, description="Opacity of polygon.")
+    showInline: bool = Field(True, description="Show labels in the same visual line.")
+    opacity: int = Field(0.2, description="Opacity of polygon.")
     fillColor: str = Field(..., description="Polygon fill color in hexadecimal.")
     strokeColor: str = Field(..., description="Stroke color in hexadecimal.")
-    strokeWidth: Optional[int] = Field(1, description="Width of stroke.")
-    pointSize: Optional[Literal["small", "medium", "large"]] = Field(
+    strokeWidth: int = Field(1, description="Width of stroke.")
+    pointSize: Literal["small", "medium", "large"] = Field(
         "medium", description="Size of polygon handle points."
     )
-    pointStyle: Optional[Literal["rectangle", "circle"]] = Field(
+    pointStyle: Literal["rectangle", "circle"] = Field(
         "rectangle", description="Style of points."
     )
-    snap: Optional[Literal["pixel", "none"]] = Field(
+    snap: Literal["pixel", "none"] = Field(
         "none", description="Snap polygon to image pixels."
     )
 
 
-class RankerTag(BaseModel):
+class RankerTag(_Tag):
     """
     Ranker Tag allows you to rank items in a List or, if Buckets are used, pick relevant items from a List.
 
@@ -479,7 +461,7 @@ class RankerTag(BaseModel):
     toName: str = Field(..., description="List tag name to connect to.")
 
 
-class RatingTag(BaseModel):
+class RatingTag(_Tag):
     """
     Rating Tag for Ratings.
 
@@ -488,18 +470,16 @@ class RatingTag(BaseModel):
 
     name: str = Field(..., description="Name of the element.")
     toName: str = Field(..., description="Name of the element that you want to label.")
-    maxRating: Optional[int] = Field(5, description="Maximum rating value.")
-    defaultValue: Optional[int] = Field(0, description="Default rating value.")
-    size: Optional[Literal["small", "medium", "large"]] = Field(
+    maxRating: int = Field(5, description="Maximum rating value.")
+    defaultValue: int = Field(0, description="Default rating value.")
+    size: Literal["small", "medium", "large"] = Field(
         "medium", description="Rating icon size."
     )
-    icon: Optional[Literal["star", "heart", "fire", "smile"]] = Field(
+    icon: Literal["star", "heart", "fire", "smile"] = Field(
         "star", description="Rating icon."
     )
     hotkey: str = Field(..., description="HotKey for changing rating value.")
-    required: Optional[bool] = Field(
-        False, description="Whether rating validation is required."
-    )
+    required: bool = Field(False, description="Whether rating validation is required.")
     requiredMessage: str = Field(
         ..., description="Message to show if validation fails."
     )
@@ -512,7 +492,7 @@ class RatingTag(BaseModel):
     )
 
 
-class RectangleTag(BaseModel):
+class RectangleTag(_Tag):
     """
     Rectangle Tag for Adding Rectangle Bounding Box to Images.
 
@@ -521,13 +501,11 @@ class RectangleTag(BaseModel):
 
     name: str = Field(..., description="Name of the element.")
     toName: str = Field(..., description="Name of the image to label.")
-    opacity: Optional[float] = Field(0.6, description="Opacity of rectangle.")
+    opacity: float = Field(0.6, description="Opacity of rectangle.")
     fillColor: str = Field(..., description="Rectangle fill color in hexadecimal.")
-    strokeColor: Optional[str] = Field(
-        "#f48a42", description="Stroke color in hexadecimal."
-    )
-    strokeWidth: Optional[int] = Field(1, description="Width of the stroke.")
-    canRotate: Optional[bool] = Field(
+    strokeColor: str = Field("#f48a42", description="Stroke color in hexadecimal.")
+    strokeWidth: int = Field(1, description="Width of the stroke.")
+    canRotate: bool = Field(
         True,
         description="Whether to show or hide rotation control. Note that the anchor point in the results is different than the anchor point used when rotating with the rotation tool. For more information, see [Rotation](/templates/image_bbox#Rotation).",
     )
@@ -539,7 +517,7 @@ class RectangleTag(BaseModel):
     )
 
 
-class RectangleLabelsTag(BaseModel):
+class RectangleLabelsTag(_Tag):
     """
     Rectangle Label Tag to Label Rectangle Bounding Box in Images.
 
@@ -548,26 +526,24 @@ class RectangleLabelsTag(BaseModel):
 
     name: str = Field(..., description="Name of the element.")
     toName: str = Field(..., description="Name of the image to label.")
-    choice: Optional[Literal["single", "multiple"]] = Field(
+    choice: Literal["single", "multiple"] = Field(
         "single", description="Configure whether you can select one or multiple labels."
     )
     maxUsages: int = Field(
         ..., description="Maximum number of times a label can be used per task."
     )
-    showInline: Optional[bool] = Field(
-        True, description="Show labels in the same visual line."
-    )
-    opacity: Optional[float] = Field(0.6, description="Opacity of rectangle.")
+    showInline: bool = Field(True, description="Show labels in the same visual line.")
+    opacity: float = Field(0.6, description="Opacity of rectangle.")
     fillColor: str = Field(..., description="Rectangle fill color in hexadecimal.")
     strokeColor: str = Field(..., description="Stroke color in hexadecimal.")
-    strokeWidth: Optional[int] = Field(1, description="Width of stroke.")
-    canRotate: Optional[bool] = Field(
+    strokeWidth: int = Field(1, description="Width of stroke.")
+    canRotate: bool = Field(
         True,
         description="Show or hide rotation control. Note that the anchor point in the results is different than the anchor point used when rotating with the rotation tool. For more information, see [Rotation](/templates/image_bbox#Rotation).",
     )
 
 
-class RelationTag(BaseModel):
+class RelationTag(_Tag):
     """
     Relation Tag for a Single Relation.
 
@@ -580,19 +556,19 @@ class RelationTag(BaseModel):
     )
 
 
-class RelationsTag(BaseModel):
+class RelationsTag(_Tag):
     """
     Relations Tag for Multiple Relations.
 
     Customize Label Studio by adding labels to relationships between labeled regions for machine learning and data science projects.
     """
 
-    choice: Optional[Literal["single", "multiple"]] = Field(
+    choice: Literal["single", "multiple"] = Field(
         "single", description="Configure whether you can select one or multiple labels."
     )
 
 
-class ShortcutTag(BaseModel):
+class ShortcutTag(_Tag):
     """
     Shortcut Tag to Define Shortcuts.
 
@@ -602,12 +578,10 @@ class ShortcutTag(BaseModel):
     value: str = Field(..., description="The value of the shortcut.")
     alias: str = Field(..., description="Shortcut alias.")
     hotkey: str = Field(..., description="Hotkey.")
-    background: Optional[str] = Field(
-        "#333333", description="Background color in hexadecimal."
-    )
+    background: str = Field("#333333", description="Background color in hexadecimal.")
 
 
-class TimelineLabelsTag(BaseModel):
+class TimelineLabelsTag(_Tag):
     """
     TimelineLabels tag.
 
@@ -618,7 +592,7 @@ class TimelineLabelsTag(BaseModel):
     toName: str = Field(..., description="Name of the video element.")
 
 
-class TimeSeriesLabelsTag(BaseModel):
+class TimeSeriesLabelsTag(_Tag):
     """
     Time Series Label Tag for Labeling Time Series Data.
 
@@ -627,26 +601,22 @@ class TimeSeriesLabelsTag(BaseModel):
 
     name: str = Field(..., description="Name of the element.")
     toname: str = Field(..., description="Name of the timeseries to label.")
-    choice: Optional[Literal["single", "multiple"]] = Field(
+    choice: Literal["single", "multiple"] = Field(
         "single", description="Configure whether you can select one or multiple labels."
     )
     maxUsages: int = Field(
         ..., description="Maximum number of times a label can be used per task."
     )
-    showInline: Optional[bool] = Field(
-        True, description="Show labels in the same visual line."
-    )
-    opacity: Optional[float] = Field(0.9, description="Opacity of the range.")
-    fillColor: Optional[str] = Field(
+    showInline: bool = Field(True, description="Show labels in the same visual line.")
+    opacity: float = Field(0.9, description="Opacity of the range.")
+    fillColor: str = Field(
         "transparent", description="Range fill color in hexadecimal or HTML color name."
     )
-    strokeColor: Optional[str] = Field(
-        "#f48a42", description="Stroke color in hexadecimal."
-    )
-    strokeWidth: Optional[int] = Field(1, description="Width of the stroke.")
+    strokeColor: str = Field("#f48a42", description="Stroke color in hexadecimal.")
+    strokeWidth: int = Field(1, description="Width of the stroke.")
 
 
-class VideoRectangleTag(BaseModel):
+class VideoRectangleTag(_Tag):
     """
     Video Tag for Video Labeling.
 
@@ -657,7 +627,7 @@ class VideoRectangleTag(BaseModel):
     toName: str = Field(..., description="Name of the element to control (video).")
 
 
-class LabelsTag(BaseModel):
+class LabelsTag(_Tag):
     """
     Labels Tag for Labeling Regions.
 
@@ -666,31 +636,29 @@ class LabelsTag(BaseModel):
 
     name: str = Field(..., description="Name of the element.")
     toName: str = Field(..., description="Name of the element that you want to label.")
-    choice: Optional[Literal["single", "multiple"]] = Field(
+    choice: Literal["single", "multiple"] = Field(
         "single",
         description="Configure whether you can select one or multiple labels for a region.",
     )
     maxUsages: int = Field(
         ..., description="Maximum number of times a label can be used per task."
     )
-    showInline: Optional[bool] = Field(
+    showInline: bool = Field(
         True, description="Whether to show labels in the same visual line."
     )
-    opacity: Optional[float] = Field(
+    opacity: float = Field(
         0.6, description="Opacity of rectangle highlighting the label."
     )
     fillColor: str = Field(..., description="Rectangle fill color in hexadecimal.")
-    strokeColor: Optional[str] = Field(
-        "#f48a42", description="Stroke color in hexadecimal."
-    )
-    strokeWidth: Optional[int] = Field(1, description="Width of the stroke.")
+    strokeColor: str = Field("#f48a42", description="Stroke color in hexadecimal.")
+    strokeWidth: int = Field(1, description="Width of the stroke.")
     value: str = Field(
         ...,
         description="Task data field containing a list of dynamically loaded labels (see example below).",
     )
 
 
-class TextAreaTag(BaseModel):
+class TextAreaTag(_Tag):
     """
     Textarea Tag for Text areas.
 
@@ -703,21 +671,19 @@ class TextAreaTag(BaseModel):
     label: str = Field(..., description="Label text.")
     placeholder: str = Field(..., description="Placeholder text.")
     maxSubmissions: str = Field(..., description="Maximum number of submissions.")
-    editable: Optional[bool] = Field(
+    editable: bool = Field(
         False, description="Whether to display an editable textarea."
     )
-    skipDuplicates: Optional[bool] = Field(
+    skipDuplicates: bool = Field(
         False, description="Prevent duplicates in textarea inputs."
     )
-    transcription: Optional[bool] = Field(
-        False, description="If false, always show editor."
-    )
-    displayMode: Optional[Literal["tag", "region-list"]] = Field(
+    transcription: bool = Field(False, description="If false, always show editor.")
+    displayMode: Literal["tag", "region-list"] = Field(
         "tag",
         description="Display mode for the textarea; region-list shows it for every region in regions list.",
     )
     rows: int = Field(..., description="Number of rows in the textarea.")
-    required: Optional[bool] = Field(
+    required: bool = Field(
         False, description="Validate whether content in textarea is required."
     )
     requiredMessage: str = Field(
@@ -0,0 +1,54 @@
+"""
+Unvalidated `dataclass` twins of the control tag models, for bulk ingest of trusted Label Studio configs.
+
+Opt in with e.g. `from label_studio_schema.control_fast import BrushTag`. The twins share field names, annotations
+and defaults with the pydantic models in `label_studio_schema.control`, but construct without any validation.
+"""
+
+import dataclasses
+from typing import Any
+
+from pydantic import BaseModel
+
+from label_studio_schema.registry import TAG_CLASSES
+
+
+def _from_dict(cls: type, data: dict[str, Any]) -> Any:
+    return cls(**data)
+
+
+def _twin(model: type[BaseModel]) -> type:
+    """
+    Build a frozen, slotted dataclass mirroring the fields of a pydantic model.
+
+    Arguments:
+    ---
+        model (type[BaseModel]):
+            The pydantic model to mirror.
+
+    Returns:
+    ---
+        type: The dataclass, with a `from_dict(data)` classmethod.
+    """
+    fields = [
+        (name, info.annotation)
+        if info.is_required()
+        else (name, info.annotation, dataclasses.field(default=info.default))
+        for name, info in model.model_fields.items()
+    ]
+    cls = dataclasses.make_dataclass(
+        model.__name__,
+        fields,
+        namespace={"__doc__": model.__doc__, "from_dict": classmethod(_from_dict)},
+        kw_only=True,
+        frozen=True,
+        slots=True,
+    )
+    cls.__module__ = __name__
+    return cls
+
+
+for _model in TAG_CLASSES:
+    globals()[_model.__name__] = _twin(_model)
+
+__all__ = tuple(_model.__name__ for _model in TAG_CLASSES)
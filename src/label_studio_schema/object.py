@@ -1,9 +1,17 @@
-from typing import Literal, Optional
+from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class AudioTag(BaseModel):
+class _Tag(BaseModel):
+    """
+    Base for the object tag models, which are plain immutable data containers.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class AudioTag(_Tag):
     """
     Audio Tag for Labeling Audio.
 
@@ -15,16 +23,16 @@ class AudioTag(BaseModel):
         ..., description="Data field containing path or a URL to the audio."
     )
     hotkey: str = Field(..., description="Hotkey used to play or pause audio.")
-    cursorwidth: Optional[str] = Field(
+    cursorwidth: str = Field(
         "1", description="Audio pane cursor width. It is measured in pixels."
     )
-    cursorcolor: Optional[str] = Field(
+    cursorcolor: str = Field(
         "#333",
         description="Audio pane cursor color. The color should be specified in hex decimal string.",
     )
 
 
-class HyperTextTag(BaseModel):
+class HyperTextTag(_Tag):
     """
     Hypertext Tags for Hypertext Markup (HTML).
 
@@ -33,25 +41,23 @@ class HyperTextTag(BaseModel):
 
     name: str = Field(..., description="Name of the element.")
     value: str = Field(..., description="Value of the element.")
-    valueType: Optional[Literal["url", "text"]] = Field(
+    valueType: Literal["url", "text"] = Field(
         "text",
         description="Whether the text is stored directly in uploaded data or needs to be loaded from a URL.",
     )
-    inline: Optional[bool] = Field(
+    inline: bool = Field(
         False,
         description="Whether to embed HTML directly in Label Studio or use an iframe.",
     )
-    saveTextResult: Literal["yes", "no"] = Field(
-        "...",
+    saveTextResult: Literal["yes", "no"] | None = Field(
+        None,
         description="Whether to store labeled text along with the results. By default, doesn't store text for `valueType=url`.",
     )
-    encoding: Literal["none", "base64", "base64unicode"] = Field(
-        "...", description="How to decode values from encoded strings."
-    )
-    selectionEnabled: Optional[bool] = Field(
-        True, description="Enable or disable selection."
+    encoding: Literal["none", "base64", "base64unicode"] | None = Field(
+        None, description="How to decode values from encoded strings."
     )
-    clickableLinks: Optional[bool] = Field(
+    selectionEnabled: bool = Field(True, description="Enable or disable selection.")
+    clickableLinks: bool = Field(
         False,
         description="Whether to allow opening resources from links in the hypertext markup.",
     )
@@ -63,12 +69,12 @@ class HyperTextTag(BaseModel):
         ...,
         description="Whether or not to show labels next to the region; unset (by default) — use editor settings; true/false — override settings.",
     )
-    granularity: Literal["symbol", "word", "sentence", "paragraph"] = Field(
-        "...", description="Control region selection granularity."
+    granularity: Literal["symbol", "word", "sentence", "paragraph"] | None = Field(
+        None, description="Control region selection granularity."
     )
 
 
-class ListTag(BaseModel):
+class ListTag(_Tag):
     """
     List Tag displays items of the same type, like articles, search results, etc.
 
@@ -83,7 +89,7 @@ class ListTag(BaseModel):
     title: str = Field(..., description="Title of the list.")
 
 
-class TableTag(BaseModel):
+class TableTag(_Tag):
     """
     Table Tag to Display Keys & Values in Tables.
 
@@ -96,7 +102,7 @@ class TableTag(BaseModel):
     valueType: str = Field(..., description="Value to define the data type in Table.")
 
 
-class TextTag(BaseModel):
+class TextTag(_Tag):
     """
     Text Tags for Text Objects.
 
@@ -105,20 +111,18 @@ class TextTag(BaseModel):
 
     name: str = Field(..., description="Name of the element.")
     value: str = Field(..., description="Data field containing text or a UR.")
-    valueType: Optional[Literal["url", "text"]] = Field(
+    valueType: Literal["url", "text"] = Field(
         "text",
         description="Whether the text is stored directly in uploaded data or needs to be loaded from a URL.",
     )
-    saveTextResult: Literal["yes", "no"] = Field(
-        "...",
+    saveTextResult: Literal["yes", "no"] | None = Field(
+        None,
         description="Whether to store labeled text along with the results. By default, doesn't store text for `valueType=url`.",
     )
-    encoding: Literal["none", "base64", "base64unicode"] = Field(
-        "...", description="How to decode values from encoded strings."
-    )
-    selectionEnabled: Optional[bool] = Field(
-        True, description="Enable or disable selection."
+    encoding: Literal["none", "base64", "base64unicode"] | None = Field(
+        None, description="How to decode values from encoded strings."
     )
+    selectionEnabled: bool = Field(True, description="Enable or disable selection.")
     highlightColor: str = Field(
         ...,
         description="Hex string with highlight color, if not provided uses the labels color.",
@@ -127,12 +131,12 @@ class TextTag(BaseModel):
         ...,
         description="Whether or not to show labels next to the region; unset (by default) — use editor settings; true/false — override settings.",
     )
-    granularity: Literal["symbol", "word", "sentence", "paragraph"] = Field(
-        "...", description="Control region selection granularity."
+    granularity: Literal["symbol", "word", "sentence", "paragraph"] | None = Field(
+        None, description="Control region selection granularity."
     )
 
 
-class TimeSeriesTag(BaseModel):
+class TimeSeriesTag(_Tag):
     """
     Time Series Tags for Time Series Data.
 
@@ -144,7 +148,7 @@ class TimeSeriesTag(BaseModel):
         ...,
         description="Key used to look up the data, either URLs for your time-series if valueType=url, otherwise expects JSON.",
     )
-    valueType: Optional[Literal["url", "json"]] = Field(
+    valueType: Literal["url", "json"] = Field(
         "url",
         description="Format of time series data provided. If set to 'url' then Label Studio loads value references inside `value` key, otherwise it expects JSON.",
     )
@@ -169,16 +173,16 @@ class TimeSeriesTag(BaseModel):
         ...,
         description="Comma-separated list of channel names or indexes displayed in overview.",
     )
-    overviewWidth: Optional[str] = Field(
+    overviewWidth: str = Field(
         "25", description="%] Default width of overview window in percents."
     )
-    fixedScale: Optional[bool] = Field(
+    fixedScale: bool = Field(
         False,
         description="Whether to scale y-axis to the maximum to fit all the values. If false, current view scales to fit only the displayed values.",
     )
 
 
-class ImageTag(BaseModel):
+class ImageTag(_Tag):
     """
     Image Tags for Images.
 
@@ -196,52 +200,46 @@ class ImageTag(BaseModel):
     smoothing: bool = Field(
         ..., description="Enable smoothing, by default it uses user settings."
     )
-    width: Optional[str] = Field("100", description="%]              - Image width.")
-    maxWidth: Optional[str] = Field("750px", description="Maximum image width.")
-    zoom: Optional[bool] = Field(
+    width: str = Field("100", description="%]              - Image width.")
+    maxWidth: str = Field("750px", description="Maximum image width.")
+    zoom: bool = Field(
         False, description="Enable zooming an image with the mouse wheel."
     )
-    negativeZoom: Optional[bool] = Field(
-        False, description="Enable zooming out an image."
-    )
-    zoomBy: Optional[float] = Field(1.1, description="Scale factor.")
-    grid: Optional[bool] = Field(False, description="Whether to show a grid.")
-    gridSize: Optional[int] = Field(30, description="Specify size of the grid.")
-    gridColor: Optional[str] = Field(
+    negativeZoom: bool = Field(False, description="Enable zooming out an image.")
+    zoomBy: float = Field(1.1, description="Scale factor.")
+    grid: bool = Field(False, description="Whether to show a grid.")
+    gridSize: int = Field(30, description="Specify size of the grid.")
+    gridColor: str = Field(
         "#EEEEF4", description="Color of the grid in hex, opacity is 0.15."
     )
-    zoomControl: Optional[bool] = Field(
-        False, description="Show zoom controls in toolbar."
-    )
-    brightnessControl: Optional[bool] = Field(
+    zoomControl: bool = Field(False, description="Show zoom controls in toolbar.")
+    brightnessControl: bool = Field(
         False, description="Show brightness control in toolbar."
     )
-    contrastControl: Optional[bool] = Field(
+    contrastControl: bool = Field(
         False, description="Show contrast control in toolbar."
     )
-    rotateControl: Optional[bool] = Field(
-        False, description="Show rotate control in toolbar."
-    )
-    crosshair: Optional[bool] = Field(False, description="Show crosshair cursor.")
-    horizontalAlignment: Optional[Literal["left", "center", "right"]] = Field(
+    rotateControl: bool = Field(False, description="Show rotate control in toolbar.")
+    crosshair: bool = Field(False, description="Show crosshair cursor.")
+    horizontalAlignment: Literal["left", "center", "right"] = Field(
         "left",
         description="Where to align image horizontally. Can be one of 'left', 'center', or 'right'.",
     )
-    verticalAlignment: Optional[Literal["top", "center", "bottom"]] = Field(
+    verticalAlignment: Literal["top", "center", "bottom"] = Field(
         "top",
         description="Where to align image vertically. Can be one of 'top', 'center', or 'bottom'.",
     )
-    defaultZoom: Optional[Literal["auto", "original", "fit"]] = Field(
+    defaultZoom: Literal["auto", "original", "fit"] = Field(
         "fit",
         description="Specify the initial zoom of the image within the viewport while preserving its ratio. Can be one of 'auto', 'original', or 'fit'.",
     )
-    crossOrigin: Optional[Literal["none", "anonymous", "use-credentials"]] = Field(
+    crossOrigin: Literal["none", "anonymous", "use-credentials"] = Field(
         "none",
         description="Configures CORS cross domain behavior for this image, either 'none', 'anonymous', or 'use-credentials', similar to [DOM `img` crossOrigin property](https://developer.mozilla.org/en-US/docs/Web/API/HTMLImageElement/crossOrigin).",
     )
 
 
-class VideoTag(BaseModel):
+class VideoTag(_Tag):
     """
     Video Tag for Video Labeling.
 
@@ -250,13 +248,11 @@ class VideoTag(BaseModel):
 
     name: str = Field(..., description="Name of the element.")
     value: str = Field(..., description="URL of the video.")
-    frameRate: Optional[int] = Field(
+    frameRate: int = Field(
         24,
         description="video frame rate per second; default is 24; can use task data like `$fps`.",
     )
     sync: str = Field(..., description="object name to sync with.")
-    muted: Optional[bool] = Field(False, description="muted video.")
-    height: Optional[int] = Field(600, description="height of the video player.")
-    timelineHeight: Optional[int] = Field(
-        64, description="height of the timeline with regions."
-    )
+    muted: bool = Field(False, description="muted video.")
+    height: int = Field(600, description="height of the video player.")
+    timelineHeight: int = Field(64, description="height of the timeline with regions.")
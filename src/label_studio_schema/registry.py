@@ -0,0 +1,172 @@
+"""
+Registry of the generated tag models, with cached adapters for validation and (de)serialization.
+
+The tag modules are regenerated by `tools/parse.py`, so everything built on top of them lives here instead.
+"""
+
+from types import MappingProxyType
+from typing import Annotated, Any, TypeVar, Union
+
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    Discriminator,
+    SerializerFunctionWrapHandler,
+    Tag,
+    TypeAdapter,
+    WrapSerializer,
+)
+
+from label_studio_schema import control, visual
+from label_studio_schema import object as object_tags
+
+TagT = TypeVar("TagT", bound=BaseModel)
+
+
+def _tag_classes(module: Any) -> tuple[type[BaseModel], ...]:
+    # every public `*Tag` model defined in a generated module, in definition order
+    return tuple(
+        obj
+        for name, obj in vars(module).items()
+        if isinstance(obj, type)
+        and issubclass(obj, BaseModel)
+        and obj.__module__ == module.__name__
+        and name.endswith("Tag")
+        and not name.startswith("_")
+    )
+
+
+TAG_CLASSES: tuple[type[BaseModel], ...] = _tag_classes(control)
+"""The control tag models, in the order they are defined in `label_studio_schema.control`."""
+_ADAPTERS: MappingProxyType[type[BaseModel], TypeAdapter] = MappingProxyType(
+    {
+        cls: TypeAdapter(cls)
+        for cls in TAG_CLASSES + _tag_classes(object_tags) + _tag_classes(visual)
+    }
+)
+"""One prebuilt `TypeAdapter` per generated tag class, control, object and visual alike."""
+
+
+def _tag_of(value: Any) -> str | None:
+    return value.get("tag") if isinstance(value, dict) else type(value).__name__
+
+
+def _drop_tag(value: Any) -> Any:
+    return (
+        {k: v for k, v in value.items() if k != "tag"}
+        if isinstance(value, dict)
+        else value
+    )
+
+
+def _add_tag(
+    value: BaseModel, handler: SerializerFunctionWrapHandler
+) -> dict[str, Any]:
+    return {"tag": type(value).__name__, **handler(value)}
+
+
+AnyTag = Annotated[
+    Union[
+        tuple(
+            Annotated[
+                cls,
+                BeforeValidator(_drop_tag),
+                WrapSerializer(_add_tag),
+                Tag(cls.__name__),
+            ]
+            for cls in TAG_CLASSES
+        )
+    ],
+    Discriminator(_tag_of),
+]
+"""Any control tag, discriminated by a `"tag"` key holding the class name, which `dumps` writes back out."""
+TAGS: TypeAdapter[list[AnyTag]] = TypeAdapter(list[AnyTag])
+
+
+def loads(data: str | bytes) -> list[BaseModel]:
+    """
+    Parse a JSON array of control tags in one pass, dispatching each item on its `"tag"` key.
+
+    Arguments:
+    ---
+        data (str | bytes):
+            The JSON array, e.g. `[{"tag": "ChoicesTag", "name": "sentiment", "toName": "text", ...}]`.
+
+    Returns:
+    ---
+        list[BaseModel]: The validated tag instances, in order.
+    """
+    return TAGS.validate_json(data)
+
+
+def dumps(tags: list[BaseModel]) -> bytes:
+    """
+    Serialize control tags to a JSON array that `loads` reads back, adding each item's `"tag"` key.
+
+    Arguments:
+    ---
+        tags (list[BaseModel]):
+            The tag instances to serialize, e.g. `[RelationsTag()]`.
+
+    Returns:
+    ---
+        bytes: The JSON array, e.g. `b'[{"tag":"RelationsTag","choice":"single"}]'`.
+    """
+    return TAGS.dump_json(tags)
+
+
+def validate(cls: type[TagT], data: Any) -> TagT:
+    """
+    Validate data into a tag using the tag's cached `TypeAdapter`.
+
+    Arguments:
+    ---
+        cls (type[TagT]):
+            The tag class to validate against, any generated control, object or visual tag.
+        data (Any):
+            The data to validate, e.g. a dict of field values.
+
+    Returns:
+    ---
+        TagT: The validated tag instance.
+    """
+    return _ADAPTERS[cls].validate_python(data)
+
+
+def dump_json(cls: type[TagT], obj: TagT) -> bytes:
+    """
+    Serialize a tag to JSON using the tag's cached `TypeAdapter`.
+
+    Arguments:
+    ---
+        cls (type[TagT]):
+            The tag class to serialize as, any generated control, object or visual tag.
+        obj (TagT):
+            The tag instance to serialize.
+
+    Returns:
+    ---
+        bytes: The JSON encoded tag.
+    """
+    return _ADAPTERS[cls].dump_json(obj)
+
+
+def fast(cls: type[TagT], **kw: Any) -> TagT:
+    """
+    Construct a tag from trusted, already validated data without running pydantic validation.
+
+    Use only for data that came from Label Studio itself or from a previously validated tag, e.g. a cached config;
+    anything user supplied should go through the normal `cls(**kw)` constructor.
+
+    Arguments:
+    ---
+        cls (type[TagT]):
+            The tag class to construct.
+        **kw (Any):
+            Field values for the tag, keyed by field name. Missing fields take their defaults.
+
+    Returns:
+    ---
+        TagT: The constructed tag instance.
+    """
+    return cls.model_construct(**kw)
@@ -1,5 +1,8 @@
 """Converters for Label Studio schema."""
 
+from functools import lru_cache
+from typing import Any, Iterable, Iterator
+
 
 def str_from_bool(value: bool, lower: bool = True) -> str:
     """
@@ -18,9 +21,54 @@ def str_from_bool(value: bool, lower: bool = True) -> str:
     return str(value).lower() if lower else str(value).upper()
 
 
+_BOOL_STR: dict[tuple[bool, bool], str] = {
+    (True, True): "true",
+    (False, True): "false",
+    (True, False): "TRUE",
+    (False, False): "FALSE",
+}  # (value, lower) -> str_from_bool(value, lower)
+
+ESCAPE_CACHE_MAX_LEN: int = 128
+"""Strings at least this long (e.g. HTML templates in `value`) are escaped directly instead of being cached."""
+
+
+def _escape_str(s: str) -> str:
+    return (
+        s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;").replace("'", "&#39;")
+    )
+
+
+_escape_str_cached = lru_cache(maxsize=65536)(_escape_str)
+
+
+def escape_xml(value: Any) -> str:
+    """
+    Convert a value to a string safe for use as an XML attribute value.
+
+    Arguments:
+    ---
+        value (Any):
+            The value to convert. Strings are escaped, with results for short strings cached since attribute values
+            are mostly drawn from a small vocabulary. Booleans are lowercased and numbers are passed through `str`
+            unescaped.
+
+    Returns:
+    ---
+        str: The escaped string representation of the value.
+    """
+    if isinstance(value, str):
+        return _escape_str_cached(value) if len(value) < ESCAPE_CACHE_MAX_LEN else _escape_str(value)
+    if value.__class__ is bool:
+        return _BOOL_STR[value, True]
+    if isinstance(value, (int, float)):
+        return str(value)
+    return escape_xml(str(value))
+
+
+@lru_cache(maxsize=256)
 def snake2camel(s: str) -> str:
     """
-    Convert a snake_case string to camelCase.
+    Convert a snake_case string to camelCase. Results are cached, attribute names repeat across every model.
 
     Arguments:
     ---
@@ -31,29 +79,28 @@ def snake2camel(s: str) -> str:
     ---
         str: The converted string in camelCase format.
     """
-    return "".join(w.capitalize() if n else w.lower() for n, w in enumerate(s.split("_")))
+    first, *rest = s.split("_")
+    return first.lower() + "".join([w[:1].upper() + w[1:] for w in rest])
 
 
-def into_xml(model_dict: dict, ignore: set[str]) -> list[str]:
+def into_xml(model_dict: dict, ignore: Iterable[str] = ()) -> Iterator[str]:
     """
-    Converts a dictionary into a list of XML attribute strings, ignoring specified keys.
+    Converts a dictionary into XML attribute strings, ignoring specified keys. Join the result with `" ".join(...)`.
 
     Arguments:
     ---
         model_dict (dict):
             The dictionary to convert, where keys are attribute names and values are attribute values.
-        ignore (set[str]):
-            A set of keys to ignore during conversion.
+        ignore (Iterable[str], optional):
+            Keys to ignore during conversion. Defaults to an empty tuple.
 
     Returns:
     ---
-        list[str]: A list of strings representing XML attributes in the format 'key="value"'.
+        Iterator[str]: Lazily yields strings representing XML attributes in the format 'key="value"'.
     """
-    res = []
-    ignore = set(list(ignore)) or set()
+    _camel, _escape = snake2camel, escape_xml
+    ignore = ignore if isinstance(ignore, (set, frozenset)) else set(ignore)
     for k, v in model_dict.items():
         if v is not None and (v or isinstance(v, bool)) and k not in ignore:
-            k: str = snake2camel(k)
-            v = str_from_bool(v) if isinstance(v, bool) else v
-            res.append(f'{k}="{v}"')
-    return res
+            yield f'{_camel(k)}="{_BOOL_STR[v, True] if v.__class__ is bool else _escape(v)}"'
+
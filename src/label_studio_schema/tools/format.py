@@ -1,5 +1,4 @@
-import xml.dom.minidom
-from xml.parsers.expat import ExpatError
+import xml.etree.ElementTree as ET
 
 
 def clean_lines(s: str) -> str:
@@ -17,7 +16,7 @@ def clean_lines(s: str) -> str:
         str: A string with each line stripped of leading and trailing whitespace,
              and only non-empty lines included, joined by newline characters.
     """
-    return "\n".join([line.strip() for line in s.splitlines() if line.strip()])
+    return "\n".join([stripped for line in s.splitlines() if (stripped := line.strip())])
 
 
 def format_xml_string(xml_string, indent_size=4) -> str:
@@ -37,11 +36,14 @@ def format_xml_string(xml_string, indent_size=4) -> str:
     
     Raises:
     ---
-        ExpatError: If there is an error parsing the XML string.
+        ET.ParseError: If there is an error parsing the XML string, reported as an "Error parsing XML: ..." string.
     """
     try:
-        dom: xml.dom.minidom.Document = xml.dom.minidom.parseString(xml_string)
-        return clean_lines(dom.toprettyxml(indent=" " * indent_size))
+        # keep `<!-- ... -->` comments and processing instructions, which the default parser drops
+        parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True, insert_pis=True))
+        root: ET.Element = ET.fromstring(xml_string, parser=parser)
+        ET.indent(root, space=" " * indent_size)
+        return ET.tostring(root, encoding="unicode")
 
-    except ExpatError as e:
+    except ET.ParseError as e:
         return f"Error parsing XML: {e}"
@@ -2,44 +2,160 @@
 Parse the tags in the Label Studio schema and generate Pydantic models.
 """
 
+import hashlib
+import json
+import os
 import re
+import string
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Generator, LiteralString
+from typing import Any, Generator, LiteralString
 
 from label_studio_schema import LS_REPO, ROOT
 
 INDENT: str = " " * 4
 TAGS_DIR: Path = LS_REPO / "web/libs/editor/src/tags"
 DOCS_DIR: Path = LS_REPO / "docs/source/tags"  # cross check
-FILES: Generator[Path, None, None] = TAGS_DIR.rglob("*.js*")
-DOCS_FILES: list[Path] = [
-    f for f in DOCS_DIR.rglob("*.md") if f.stem != "index"
-]  # ignore index.md and tags not found here
-
-TAG_NAME: re.Pattern[str] = re.compile(r"@name(.*)")
-TAG_META_TITLE: re.Pattern[str] = re.compile(r"@meta_title(.*)")
-TAG_DESC: re.Pattern[str] = re.compile(r"@meta_description(.*)")
-MULTILINE_COMMENT: re.Pattern[str] = re.compile(r"/\*\*(.*?)\*/", re.DOTALL)
-TAG_ARG_RGX: re.Pattern[str] = re.compile(
-    r"@param\s\{([-a-zA-Z0-9|]+=?)\}\s\[?(\w+)(=[a-zA-Z-0-9.#:]+)?\]?(.*)\n"
-)
-TAG_MODEL_RGX: re.Pattern[str] = re.compile(r"types.model\((.*?)\);", re.DOTALL)
+CACHE_FILE: Path = LS_REPO.parent / "parse_cache.json"  # per-file results, keyed by content hash
+GENERATOR_DIGEST: str = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()  # invalidates the cache on edits
+
+
+def iter_tag_files(directory: Path) -> Generator[Path, None, None]:
+    """
+    Recursively yield the JavaScript sources below a directory, in the same order as `Path.rglob("*.js*")`.
+
+    Arguments:
+    ---
+        directory (Path):
+            The directory to walk.
+
+    Returns:
+    ---
+        Generator[Path, None, None]: The paths of the matching files. Dunder-prefixed helper files are skipped
+        without being passed to `files2keep`.
+    """
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.append(entry.path)
+            elif ".js" in entry.name and not entry.name.startswith("__"):
+                yield Path(entry.path)
+    for subdir in subdirs:
+        yield from iter_tag_files(subdir)
+
+
+@lru_cache(maxsize=1)
+def _doc_index() -> dict[str, Path]:
+    # case-insensitive stem -> docs page, walked on first use so importing this module doesn't touch the docs tree
+    return {
+        f.stem.casefold(): f for f in DOCS_DIR.rglob("*.md") if f.stem != "index"
+    }  # ignore index.md and tags not found here
+
+
+def __getattr__(name: str) -> list[Path]:
+    if name == "DOCS_FILES":
+        value = globals()[name] = list(_doc_index().values())
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+TAG_ANY: re.Pattern[str] = re.compile(r"@(name|meta_title|meta_description|param)\b([^\n]*)")
 TYPE_CONVERT: dict[str, str] = {
     "string": "str",
     "number": "int",
+    "int": "int",
     "float": "float",
     "boolean": "bool",
     "array": "list",
     "object": "dict",
     "function": "Callable",
+    "style": "str",  # a CSS style string, e.g. `{style} [style]` on Choice
     "null": "None",
 }
+_TYPE_KEYS: frozenset[str] = frozenset(TYPE_CONVERT)
+_TYPE_CHARS: frozenset[str] = frozenset("-|" + string.ascii_letters + string.digits)
+_DEFAULT_CHARS: frozenset[str] = frozenset("-.#:" + string.ascii_letters + string.digits)
+
+
+def parse_param_line(line: str) -> tuple[str, str, str, str] | None:
+    """
+    Split a JSDoc `@param {type} [name=default] description` line into its parts with a single linear scan. A
+    default stops at the first character outside `[-a-zA-Z0-9.#:]`, anything after it is left in the description.
+
+    Arguments:
+    ---
+        line (str):
+            A single comment line starting with `@param`, without the trailing newline.
+
+    Returns:
+    ---
+        tuple[str, str, str, str] | None: The type, name, default (including the leading "=", or "" when absent) and
+        the rest of the line, or None when the line does not match the expected format.
+    """
+    n = len(line)
+    if n < 9 or not line.startswith("@param") or not line[6].isspace() or line[7] != "{":
+        return None
+
+    close = line.find("}", 8)
+    arg_type = line[8:close] if close != -1 else ""
+    type_chars = arg_type[:-1] if arg_type.endswith("=") else arg_type  # optional marker, e.g. `{string=}`
+    if not type_chars or not _TYPE_CHARS.issuperset(type_chars):
+        return None
+
+    i = close + 1
+    if i >= n or not line[i].isspace():
+        return None
+    i += 1
+    if line.startswith("[", i):
+        i += 1
+
+    j = i
+    while j < n and (line[j].isalnum() or line[j] == "_"):
+        j += 1
+    if j == i:
+        return None
+    arg_name = line[i:j]
+
+    arg_default = ""
+    if line.startswith("=", j):
+        k = j + 1
+        while k < n and line[k] in _DEFAULT_CHARS:
+            k += 1
+        if k > j + 1:
+            arg_default, j = line[j:k], k
+    if line.startswith("]", j):
+        j += 1
+
+    return arg_type, arg_name, arg_default, line[j:]
+
+
+@lru_cache(maxsize=1024)
+def _py_types(type_names: tuple[str, ...]) -> tuple[bool, str]:
+    """
+    Map JSDoc type names to a Python annotation, cached since most parameters share a handful of type shapes.
+
+    Arguments:
+    ---
+        type_names (tuple[str, ...]):
+            The type names of a parameter, in documented order, e.g. `("int", "string")`.
+
+    Returns:
+    ---
+        tuple[bool, str]: Whether any name is not a known type, in which case the annotation is a `Literal` over the
+        names, and the annotation.
+    """
+    if _TYPE_KEYS.issuperset(type_names):
+        return False, "|".join([TYPE_CONVERT[t] for t in type_names])
+    return True, "Literal[" + ", ".join([f'"{t}"' for t in type_names]) + "]"
 
 
 def convert_arg_types(type_list: list[str], is_optional: bool, arg_default: str) -> tuple[str, str]:
     """
     Converts a list of argument types to a string representation suitable for type hints,
-    and adjusts the default argument value based on the type and optionality.
+    and adjusts the default argument value based on the type and optionality. Types are only
+    made optional (`T | None`) when the default is `None`.
     
     Arguments:
     ---
@@ -55,28 +171,42 @@ def convert_arg_types(type_list: list[str], is_optional: bool, arg_default: str)
         tuple[str, str]: A tuple containing the adjusted default argument value and the 
                          string representation of the argument types.
     """
-    arg_types = "|".join([TYPE_CONVERT.get(t, "str") for t in type_list])
+    is_literal, arg_types = _py_types(tuple(type_list))
+    if is_literal:  # e.g. `{single|multiple}`, a choice between literal values
+        if arg_default == "...":  # no documented default, a `"..."` default would never match the Literal
+            return "None", f"{arg_types} | None"
+        return f'"{arg_default}"', arg_types
 
     if arg_types == "bool" and is_optional:
-        arg_default = arg_default == "true" and arg_default != "false"
+        arg_default = arg_default == "true"
     elif arg_types == "str" and is_optional:
         arg_default = (
             f'"{arg_default}"' if arg_default not in ["...", "None"] else arg_default
         )
 
-    if not all(t in TYPE_CONVERT for t in type_list):
-        arg_types = (
-            f"{'Optional[' if is_optional else ''}Literal["
-            + ", ".join([f'"{t}"' for t in type_list])
-            + f"]{']' if is_optional else ''}"
-        )
-        arg_default: str = f'"{arg_default}"'
-    elif is_optional:
-        arg_types: str = f"Optional[{arg_types}]"
+    if is_optional and arg_default == "None":  # a real default never needs the None branch
+        arg_types = f"{arg_types} | None"
 
     return arg_default, arg_types
 
 
+def _terminate(s: str) -> str:
+    """
+    Strip trailing whitespace and make sure the text ends with a period.
+
+    Arguments:
+    ---
+        s (str):
+            The text to terminate, e.g. a title or description.
+
+    Returns:
+    ---
+        str: The text without trailing whitespace, ending in a period.
+    """
+    s = s.rstrip()
+    return s if s.endswith(".") else s + "."
+
+
 def make_args(args: list[tuple[str]]) -> list[str]:
     """
     Converts a list of argument tuples into a list of formatted argument strings.
@@ -95,19 +225,17 @@ def make_args(args: list[tuple[str]]) -> list[str]:
         list[str]: A list of formatted argument strings suitable for use in a Pydantic model.
     """
     str_args = []
-    for arg_type, arg_name, arg_default, arg_desc in args:
-        arg_name: str = str(arg_name).strip()
-        arg_desc = str(arg_desc).strip().strip("- ").replace('"', "'")
-        arg_desc: str = arg_desc if str(arg_desc).endswith(".") else arg_desc + "."
+    _append = str_args.append
+    for arg_type, arg_name, arg_default, arg_desc in args:  # regex groups, already `str`
+        arg_name = arg_name.strip()
+        arg_desc = _terminate(arg_desc.strip().strip("- ").replace('"', "'"))
         is_opt: bool = "=" in arg_default
 
-        arg_default: str = str(arg_default).strip("=").strip() if arg_default else ("None" if is_opt else "...")
+        arg_default = arg_default.strip("=").strip() if arg_default else ("None" if is_opt else "...")
         _types: list[str] = [t.strip("=") for t in arg_type.split("|")]
         arg_default, arg_types = convert_arg_types(_types, is_opt, arg_default)
 
-        str_args.append(
-            f'{INDENT}{arg_name}: {arg_types} = Field({arg_default}, description="{arg_desc}")'
-        )
+        _append(f'{INDENT}{arg_name}: {arg_types} = Field({arg_default}, description="{arg_desc}")')
 
     return str_args
 
@@ -128,79 +256,201 @@ def files2keep(file: Path) -> bool:
     Criteria:
     ---
         - The file name does not contain double underscores ("__").
-        - The file name (case insensitive) is in the list of document files (DOCS_FILES).
+        - The file name (case insensitive) is in the list of document files (DOCS_FILES), looked up in `_doc_index()`.
         - If the file name (case insensitive) is "view", its parent directory must be named "visual".
     """
+    stem = file.stem
+    folded = stem.casefold()
     return (
-        "__" not in file.stem
-        and file.stem.lower() in [f.stem.lower() for f in DOCS_FILES]
-        and (file.parent.name == "visual" if file.stem.lower() == "view" else True)
+        "__" not in stem
+        and folded in _doc_index()
+        and (file.parent.name == "visual" if folded == "view" else True)
     )  # NOTE object/RichText/view.jsx not properly filtered
 
+BASE_CLASS: str = (
+    "class _Tag(BaseModel):\n"
+    f'{INDENT}"""\n{INDENT}Base for the {{}} tag models, which are plain immutable data containers.\n{INDENT}"""\n\n'
+    f'{INDENT}model_config = ConfigDict(frozen=True, extra="forbid")\n\n\n'
+)
+
+
+def _scan_comment(comment: str) -> dict[str, Any]:
+    """
+    Collect the meta tags and parameters of a tag's doc comment in a single pass.
+
+    Arguments:
+    ---
+        comment (str):
+            The text of the `/** ... */` block.
+
+    Returns:
+    ---
+        dict[str, Any]: The unstripped text after the first `@name`, `@meta_title` and `@meta_description` (keys only
+        present when found), and "params", the `parse_param_line` results for every `@param` line in order.
+    """
+    fields: dict[str, Any] = {"params": []}
+    add_param = fields["params"].append
+    for m in TAG_ANY.finditer(comment):
+        key, rest = m.groups()
+        if key == "param":
+            if arg := parse_param_line(m.group()):
+                add_param(arg)
+        elif key not in fields:
+            fields[key] = rest
+    return fields
+
+
+def generate_model(file: Path, text: bytes) -> tuple[str, str] | None:
+    """
+    Generate the Pydantic model source for a single tag file.
+
+    Arguments:
+    ---
+        file (Path):
+            The tag source file, used for the class name and output module.
+        text (bytes):
+            The raw contents of the file, only the doc comment is decoded.
+
+    Returns:
+    ---
+        tuple[str, str] | None: The output module name (e.g. "control.py") and the class source, or None when the
+        file has no documented parameters.
+    """
+    tag_dir: str = file.parent.relative_to(TAGS_DIR).parts
+    tag_dir = tag_dir[0] if tag_dir else "control"
+
+    # first /** ... */ block, located with plain substring searches
+    start = text.find(b"/**")
+    end = text.find(b"*/", start + 3) if start != -1 else -1
+
+    if end != -1:
+        comment = text[start + 3 : end].decode("utf-8").strip()
+        comment += "\n" if not comment.endswith("\n") else ""
+
+        fields: dict[str, Any] = _scan_comment(comment)
+        args: list[tuple[str, str, str, str]] = fields["params"]
+
+        if (meta_title := fields.get("meta_title")) is not None:
+            meta_title: str = _terminate(meta_title.strip())
+
+        if (meta_desc := fields.get("meta_description")) is not None:
+            meta_desc: str = meta_desc.strip()
+
+            if args:
+                arg_block: str = "\n".join(make_args(args))
+            else:
+                arg_block = ""
+
+            if arg_block:
+                if not (meta_title or meta_desc):
+                    meta_title: str = comment.splitlines()[0].strip("*").strip()
+                doc_str = (
+                    f'{INDENT}"""\n{INDENT}{meta_title}\n\n{INDENT}{meta_desc}\n{INDENT}"""\n'
+                    if meta_desc
+                    else f'{INDENT}"""\n{INDENT}{meta_title}\n{INDENT}"""\n'
+                )
+                text_out: str = (
+                    f"class {file.stem}Tag(_Tag):\n{doc_str}{arg_block}\n"
+                )
+                return tag_dir + ".py", text_out
+
+    return None
+
+
+def process_file(file: Path, cache: dict[str, list] | None = None) -> tuple[str, tuple[str, str] | None]:
+    """
+    Read a tag file and generate its model source, reusing the cached result when the file is unchanged.
+
+    Arguments:
+    ---
+        file (Path):
+            The tag source file to parse.
+        cache (dict[str, list] | None, optional):
+            Previous results as `{relative path: [sha256, result]}`, see `CACHE_FILE`. Defaults to None.
+
+    Returns:
+    ---
+        tuple[str, tuple[str, str] | None]: The sha256 hex digest of the file and the result of `generate_model`.
+    """
+    text = file.read_bytes()
+    digest = hashlib.sha256(text).hexdigest()
+    if cache and (hit := cache.get(file.relative_to(TAGS_DIR).as_posix())) and hit[0] == digest:
+        return digest, (tuple(hit[1]) if hit[1] else None)
+    return digest, generate_model(file, text)
+
+
+def load_cache() -> dict[str, list]:
+    """
+    Load the per-file results of the previous run, discarding them if the generator itself has changed since.
+
+    Returns:
+    ---
+        dict[str, list]: Cached results as `{relative path: [sha256, result]}`, empty when there is no usable cache.
+    """
+    try:
+        data = json.loads(CACHE_FILE.read_text("utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data["files"] if data.get("generator") == GENERATOR_DIGEST else {}
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """
+    Write text to a file as UTF-8, leaving the file untouched (and its mtime unchanged) if it already has that content.
+
+    Arguments:
+    ---
+        path (Path):
+            The file to write.
+        text (str):
+            The new file contents.
+
+    Returns:
+    ---
+        bool: True if the file was written, False if it was already up to date.
+    """
+    encoded = text.encode("utf-8")
+    try:
+        if path.read_bytes() == encoded:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(encoded)
+    return True
+
+
 def main() -> None:
 
     # Construct imports
-    BASE_IMPORTS: str = "\n".join(["from typing import Literal, Optional", ""])
-    THIRD_PARTY_IMPORTS: str = "\n".join(["from pydantic import BaseModel, Field", ""])
+    BASE_IMPORTS: str = "\n".join(["from typing import Literal", ""])
+    THIRD_PARTY_IMPORTS: str = "\n".join(["from pydantic import BaseModel, ConfigDict, Field", ""])
     LOCAL_IMPORTS: str = "\n".join([""])
 
     _imports: LiteralString = (
         BASE_IMPORTS + "\n" + THIRD_PARTY_IMPORTS + "\n" + LOCAL_IMPORTS
     )
 
-    # Parse files
-    py_files = {}
-    for file in filter(files2keep, FILES):
-        text = file.read_text("utf-8")
-        tag_dir: str = file.parent.relative_to(TAGS_DIR).parts
-        tag_dir = tag_dir[0] if tag_dir else "control"
-
-        comment: re.Match[str] | None = MULTILINE_COMMENT.search(text)
-
-        if comment is not None:
-            comment = str(comment.group(1)).strip()
-            comment += "\n" if not str(comment).endswith("\n") else ""
-
-            if name := TAG_NAME.search(comment):
-                name: str = str(name.group(1)).strip() if name else file.stem
-
-            if meta_title := TAG_META_TITLE.search(comment):
-                meta_title: str = (
-                    str(meta_title.group(1)).strip()
-                    + ("" if str(meta_title.group()).endswith(".") else ".")
-                    if meta_title
-                    else ""
-                )
-
-            if meta_desc := TAG_DESC.search(comment):
-                meta_desc: str = str(meta_desc.group(1)).strip() if meta_desc else ""
-
-                args: list[tuple[str]] = TAG_ARG_RGX.findall(comment)
-                if args:
-                    arg_block: str = "\n".join(make_args(args))
-                else:
-                    arg_block = ""
-
-                if arg_block:
-                    if not (meta_title or meta_desc):
-                        meta_title: str = str(comment).splitlines()[0].strip("*").strip()
-                    doc_str = (
-                        f'{INDENT}"""\n{INDENT}{meta_title}\n\n{INDENT}{meta_desc}\n{INDENT}"""\n'
-                        if meta_desc
-                        else f'{INDENT}"""\n{INDENT}{meta_title}\n{INDENT}"""\n'
-                    )
-                    text_out: str = (
-                        f"class {file.stem}Tag(BaseModel):\n{doc_str}{arg_block}\n"
-                    )
-                    key = tag_dir + ".py"
-                    if key in py_files:
-                        py_files[key] += f"\n\n{text_out}"
-                    else:
-                        py_files[key] = f"{_imports}\n" + text_out
+    # Parse files, one per worker task; map() keeps the results in file order
+    py_files: dict[str, list[str]] = {}
+    # sorted, so the class order in the generated modules does not depend on the filesystem's listing order
+    files: list[Path] = sorted(
+        filter(files2keep, iter_tag_files(TAGS_DIR)), key=lambda f: f.relative_to(TAGS_DIR).as_posix().casefold()
+    )
+    cache: dict[str, list] = {}
+    with ProcessPoolExecutor() as ex:
+        results = ex.map(partial(process_file, cache=load_cache()), files, chunksize=16)
+        for file, (digest, result) in zip(files, results):
+            cache[file.relative_to(TAGS_DIR).as_posix()] = [digest, result]
+            if result is not None:
+                key, text_out = result
+                py_files.setdefault(key, []).append(text_out)
+    if not py_files:  # e.g. an empty or unexpected checkout, keep the committed modules and cache as they are
+        raise SystemExit(f"No tags generated from {TAGS_DIR}, nothing written.")
+    write_if_changed(CACHE_FILE, json.dumps({"generator": GENERATOR_DIGEST, "files": cache}))
 
     # Write to files
     for k, v in py_files.items():
-        (ROOT / k).write_text(v, "utf-8")
+        write_if_changed(ROOT / k, f"{_imports}\n" + BASE_CLASS.format(k[:-3]) + "\n\n".join(v))
 
 
 if __name__ == "__main__":
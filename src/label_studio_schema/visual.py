@@ -1,9 +1,17 @@
-from typing import Literal, Optional
+from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class FilterTag(BaseModel):
+class _Tag(BaseModel):
+    """
+    Base for the visual tag models, which are plain immutable data containers.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class FilterTag(_Tag):
     """
     Filter Tag for Filter Search.
 
@@ -13,14 +21,14 @@ class FilterTag(BaseModel):
     placeholder: str = Field(
         ..., description="='Quick Filter']      - Placeholder text for filter."
     )
-    minlength: Optional[int] = Field(3, description="Size of the filter.")
+    minlength: int = Field(3, description="Size of the filter.")
     style: str = Field(..., description="CSS style of the string.")
     hotkey: str = Field(
         ..., description="Hotkey to use to focus on the filter text area."
     )
 
 
-class HeaderTag(BaseModel):
+class HeaderTag(_Tag):
     """
     Header Tag to Show Headers.
 
@@ -31,16 +39,14 @@ class HeaderTag(BaseModel):
         ...,
         description="Text of header, either static text or the field name in data to use for the header.",
     )
-    size: Optional[int] = Field(
+    size: int = Field(
         4, description="Level of header on a page, used to control size of the text."
     )
     style: str = Field(..., description="CSS style for the header.")
-    underline: Optional[bool] = Field(
-        False, description="Whether to underline the header."
-    )
+    underline: bool = Field(False, description="Whether to underline the header.")
 
 
-class StyleTag(BaseModel):
+class StyleTag(_Tag):
     """
     Style Tag to use CSS Styles.
 
@@ -50,23 +56,29 @@ class StyleTag(BaseModel):
     CSS: str = Field(..., description="property]  - CSS property and value to apply.")
 
 
-class ViewTag(BaseModel):
+class ViewTag(_Tag):
     """
     View Tag for Defining How Blocks are Displayed.
 
     Customize how blocks are displayed on the labeling interface in Label Studio for machine learning and data science projects.
     """
 
-    display: Literal["block", "inline"] = Field("...", description=".")
+    display: Literal["block", "inline"] | None = Field(None, description=".")
     style: str = Field(..., description="CSS style string.")
     className: str = Field(
         ..., description="Class name of the CSS style to apply. Use with the Style tag."
     )
     idAttr: str = Field(..., description="Unique ID attribute to use in CSS.")
-    visibleWhen: Literal[
-        "region-selected", "choice-selected", "no-region-selected", "choice-unselected"
-    ] = Field(
-        "...",
+    visibleWhen: (
+        Literal[
+            "region-selected",
+            "choice-selected",
+            "no-region-selected",
+            "choice-unselected",
+        ]
+        | None
+    ) = Field(
+        None,
         description="Control visibility of the content. Can also be used with the `when*` parameters below to narrow visibility.",
     )
     whenTagName: str = Field(
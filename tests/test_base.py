@@ -0,0 +1,100 @@
+from io import StringIO
+
+from pydantic import Field, computed_field, field_serializer, model_serializer
+
+from label_studio_schema.base import Control, Object
+
+
+class Foo(Object):
+    count: int | bool = 0
+    scale: float | int = 1.0
+
+
+def test_xml_cache_keeps_equal_values_of_different_types_apart():
+    assert 'count="1"' in Foo(name="f", value="v", count=1).xml()
+    assert 'count="true"' in Foo(name="f", value="v", count=True).xml()
+    assert 'scale="1"' in Foo(name="f", value="v", scale=1).xml()
+    assert 'scale="1.0"' in Foo(name="f", value="v", scale=1.0).xml()
+
+
+def test_xml_skips_fields_missing_from_model_construct():
+    foo = Foo.model_construct(name="f")
+    assert foo.xml() == '<Foo name="f" scale="1.0" />'
+    assert str(foo) == foo.xml()
+    assert foo.xml(no_defaults=True) == '<Foo name="f" />'
+
+
+def test_render_paths_skip_the_same_values():
+    foo = Foo(name="f", value="", count=False, scale=0.0)
+    buf = StringIO()
+    foo.write_xml(buf)
+    assert foo.xml() == buf.getvalue() == '<Foo name="f" count="false" />'
+    assert foo.to_element().attrib == {"name": "f", "count": "false"}
+
+
+def test_xml_no_defaults_keeps_equal_values_of_different_types_apart():
+    assert Foo(name="f", value="v", count=1).xml(no_defaults=True) == '<Foo name="f" value="v" count="1" />'
+    assert Foo(name="f", value="v", count=True).xml(no_defaults=True) == '<Foo name="f" value="v" count="true" />'
+
+
+class Secret(Control):
+    secret: str = Field("s", exclude=True)
+
+
+class Shouty(Control):
+    color: str = "red"
+
+    @field_serializer("color")
+    def _upper(self, value: str) -> str:
+        return value.upper()
+
+
+class Fixed(Control):
+    @model_serializer
+    def _fixed(self) -> dict[str, str]:
+        return {"name": "fixed", "to_name": self.to_name}
+
+
+class Area(Control):
+    width: int = 2
+
+    @computed_field
+    @property
+    def area(self) -> int:
+        return self.width * 2
+
+
+def test_xml_omits_excluded_fields():
+    tag = Secret(name="n", to_name="t")
+    assert tag.xml() == str(tag) == '<Secret name="n" toName="t" />'
+    assert "secret" not in tag.to_element().attrib
+
+
+def test_xml_applies_field_serializers():
+    tag = Shouty(name="n", to_name="t")
+    assert tag.xml() == '<Shouty name="n" toName="t" color="RED" />'
+    blue = Shouty(name="n", to_name="t", color="blue")
+    assert blue.xml(no_defaults=True) == '<Shouty name="n" toName="t" color="BLUE" />'
+
+
+def test_xml_applies_model_serializers():
+    assert Fixed(name="n", to_name="t").xml() == '<Fixed name="fixed" toName="t" />'
+
+
+def test_xml_renders_computed_fields():
+    tag = Area(name="n", to_name="t", width=3)
+    assert tag.xml() == '<Area name="n" toName="t" width="3" area="6" />'
+    assert tag.to_element().attrib["area"] == "6"
+
+
+def test_validated_data_default_factories_run_per_instance():
+    calls = []
+
+    class Derived(Control):
+        label: str = Field(default_factory=lambda data: calls.append(data["name"]) or data["name"].upper())
+
+    assert calls == []  # defining the class must not call the factory
+    assert Derived(name="n", to_name="t").xml(no_defaults=True) == '<Derived name="n" toName="t" />'
+    assert Derived(name="n", to_name="t", label="N").xml(no_defaults=True) == '<Derived name="n" toName="t" />'
+    custom = Derived(name="n", to_name="t", label="x")
+    assert custom.xml(no_defaults=True) == '<Derived name="n" toName="t" label="x" />'
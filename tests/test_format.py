@@ -0,0 +1,12 @@
+from label_studio_schema.tools.format import format_xml_string
+
+
+def test_format_keeps_comments():
+    xml = '<View><!-- image task --><Image name="img" value="$image"/></View>'
+    assert format_xml_string(xml) == (
+        '<View>\n    <!-- image task -->\n    <Image name="img" value="$image" />\n</View>'
+    )
+
+
+def test_format_reports_parse_errors():
+    assert format_xml_string("<View>").startswith("Error parsing XML: ")
@@ -0,0 +1,64 @@
+import pytest
+
+from label_studio_schema.tools.parse import convert_arg_types, make_args, parse_param_line
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("@param {string} name - Name of the element", ("string", "name", "", " - Name of the element")),
+        ("@param {string} [value] - Value", ("string", "value", "", " - Value")),
+        ("@param {number} [opacity=0.6] - Opacity", ("number", "opacity", "=0.6", " - Opacity")),
+        ("@param {string} [fillColor=#f48a42] Fill color", ("string", "fillColor", "=#f48a42", " Fill color")),
+        ("@param {boolean=} [smart] - Smart", ("boolean=", "smart", "", " - Smart")),
+        ("@param {single|multiple} [choice=single] - Choice", ("single|multiple", "choice", "=single", " - Choice")),
+        # a default stops at the first character outside `[-a-zA-Z0-9.#:]`, the rest stays in the description
+        ("@param {string} [url=http://x.y] rest", ("string", "url", "=http:", "//x.y] rest")),
+        ("@param {string} [a=b c] x", ("string", "a", "=b", " c] x")),
+    ],
+)
+def test_parse_param_line(line, expected):
+    assert parse_param_line(line) == expected
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "@param {string}name",
+        "@param{string} name",
+        "@parameter {string} name",
+        "@param {str ing} name",
+        "@param {string} [=x]",
+        "@param {} name",
+    ],
+)
+def test_parse_param_line_rejects_malformed_lines(line):
+    assert parse_param_line(line) is None
+
+
+@pytest.mark.parametrize(
+    "type_list, is_optional, arg_default, expected",
+    [
+        (["string"], True, "top", ('"top"', "str")),
+        (["string"], True, "None", ("None", "str | None")),
+        (["string"], False, "...", ("...", "str")),
+        (["boolean"], True, "true", (True, "bool")),
+        (["boolean"], True, "false", (False, "bool")),
+        (["number"], True, "0.6", ("0.6", "int")),
+        (["int", "string"], False, "...", ("...", "int|str")),
+        # unknown type names are Literal choices, quoted once
+        (["top"], True, "top", ('"top"', 'Literal["top"]')),
+        (["top", "bottom"], True, "bottom", ('"bottom"', 'Literal["top", "bottom"]')),
+        # without a documented default, a Literal field is optional instead of defaulting to `"..."`
+        (["top", "bottom"], False, "...", ("None", 'Literal["top", "bottom"] | None')),
+    ],
+)
+def test_convert_arg_types(type_list, is_optional, arg_default, expected):
+    assert convert_arg_types(type_list, is_optional, arg_default) == expected
+
+
+def test_make_args_quotes_literal_defaults_once():
+    assert make_args([("top", "pos", "=top", "Position"), ("yes|no", "save", "", "- Save")]) == [
+        '    pos: Literal["top"] = Field("top", description="Position.")',
+        '    save: Literal["yes", "no"] | None = Field(None, description="Save.")',
+    ]
@@ -0,0 +1,18 @@
+from label_studio_schema.control import BrushLabelsTag, RelationsTag
+from label_studio_schema.registry import _ADAPTERS, dumps, loads
+
+
+def test_dumps_round_trips_through_loads():
+    tags = [RelationsTag(), RelationsTag(choice="multiple")]
+    assert dumps(tags) == b'[{"tag":"RelationsTag","choice":"single"},{"tag":"RelationsTag","choice":"multiple"}]'
+    assert loads(dumps(tags)) == tags
+
+
+def test_dumps_round_trips_mixed_tags():
+    tags = [BrushLabelsTag(name="brush", toName="img", maxUsages=3), RelationsTag()]
+    assert loads(dumps(tags)) == tags
+
+
+def test_adapters_cover_every_generated_module():
+    modules = {cls.__module__.rsplit(".", 1)[-1] for cls in _ADAPTERS}
+    assert modules == {"control", "object", "visual"}